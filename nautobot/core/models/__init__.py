@@ -17,7 +17,7 @@ from nautobot.core.models.querysets import (
     LocationToLocationsQuerySetMixin,
     RestrictedQuerySet,
 )
-from nautobot.core.models.utils import construct_composite_key, construct_natural_slug, deconstruct_composite_key
+from nautobot.core.models.utils import construct_composite_key, construct_natural_slug, deconstruct_composite_key, uuid7
 from nautobot.core.utils.cache import construct_cache_key
 from nautobot.core.utils.lookup import get_route_for_model
 
@@ -331,6 +331,19 @@ class BaseModel(models.Model):
         return dict(zip(natural_key_field_lookups, args))
 
 
+class UUID7PrimaryKeyMixin(models.Model):
+    """
+    Abstract mixin overriding the `BaseModel` primary key to default to a time-ordered (version 7) UUID.
+
+    Must be listed before `BaseModel` (or any of its subclasses) in the model's bases so that its `id` field wins.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid7, unique=True, editable=False)
+
+    class Meta:
+        abstract = True
+
+
 class ContentTypeRelatedQuerySet(RestrictedQuerySet):
     def get_for_model(self, model):
         """
@@ -1,7 +1,10 @@
 from itertools import count, groupby
 import json
+import os
+import time
 import unicodedata
 from urllib.parse import quote_plus, unquote_plus
+import uuid
 
 from django.apps import apps
 from django.core.exceptions import FieldDoesNotExist
@@ -24,6 +27,21 @@ def array_to_string(array):
     return ", ".join("-".join(map(str, (g[0], g[-1])[: len(g)])) for g in group)
 
 
+def uuid7():
+    """
+    Generate a time-ordered (version 7) UUID as defined in RFC 9562.
+
+    The most significant 48 bits hold the current Unix timestamp in milliseconds and the remaining bits (other than the
+    version and variant bits) are random. Unlike version 4 UUIDs, successively generated values sort in (approximately)
+    creation order, so using them as primary keys appends new rows to the right-hand side of the B-tree index instead of
+    scattering inserts (and page splits) across the whole index.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 9562 variant
+    return uuid.UUID(int=value)
+
+
 def get_all_concrete_models(base_class):
     """Get a list of all non-abstract models that inherit from the given base_class."""
     models = []
@@ -8,11 +8,17 @@ from django.core.exceptions import ValidationError
 from django.test import override_settings
 from django.test.utils import isolate_apps
 
-from nautobot.core.models import BaseModel
-from nautobot.core.models.utils import construct_composite_key, construct_natural_slug, deconstruct_composite_key
+from nautobot.core.models import BaseModel, UUID7PrimaryKeyMixin
+from nautobot.core.models.utils import (
+    construct_composite_key,
+    construct_natural_slug,
+    deconstruct_composite_key,
+    uuid7,
+)
 from nautobot.core.testing import TestCase
 from nautobot.dcim.models import DeviceType, Location, LocationType, Manufacturer
 from nautobot.extras.models import Status
+from nautobot.ipam.models import IPAddress, Prefix
 
 
 @isolate_apps("nautobot.core.tests")
@@ -21,10 +27,22 @@ class BaseModelTest(TestCase):
         def clean(self):
             raise ValidationError("validation error")
 
+    class FakeUUID7Model(UUID7PrimaryKeyMixin, BaseModel):
+        pass
+
     def test_validated_save_calls_full_clean(self):
         with self.assertRaises(ValidationError):
             self.FakeBaseModel().validated_save()
 
+    def test_uuid7_primary_key_mixin(self):
+        """Test that `UUID7PrimaryKeyMixin` overrides the `BaseModel` primary key default."""
+        self.assertIs(self.FakeBaseModel._meta.pk.default, uuid.uuid4)
+        for model in (self.FakeUUID7Model, Prefix, IPAddress):
+            with self.subTest(model=model):
+                self.assertEqual(model._meta.pk.name, "id")
+                self.assertIs(model._meta.pk.default, uuid7)
+                self.assertEqual(model().pk.version, 7)
+
 
 class ModelUtilsTestCase(TestCase):
     @skip("Composite keys aren't being supported at this time")
@@ -59,6 +77,18 @@ class ModelUtilsTestCase(TestCase):
                 natural_slug = construct_natural_slug(values, pk=pk)
                 self.assertEqual(natural_slug, expected_natural_slug)
 
+    def test_uuid7(self):
+        """Test that `uuid7()` returns RFC 9562 version 7 UUIDs that are ordered by creation time."""
+        first = uuid7()
+        time.sleep(0.002)
+        second = uuid7()
+        for value in (first, second):
+            self.assertIsInstance(value, uuid.UUID)
+            self.assertEqual(value.version, 7)
+            self.assertEqual(value.variant, uuid.RFC_4122)
+        self.assertLess(first, second)
+        self.assertAlmostEqual(second.int >> 80, time.time_ns() // 1_000_000, delta=1000)
+
 
 class NaturalKeyTestCase(BaseModelTest):
     """Test the various natural-key APIs for a few representative models."""
@@ -1,9 +1,11 @@
+import socket
+
 from django.core.exceptions import ValidationError
 from django.db import models
 import netaddr
 
 from . import lookups
-from .constants import IPV4_BYTE_LENGTH
+from .constants import IPV4_BYTE_LENGTH, IPV6_BYTE_LENGTH
 from .formfields import IPNetworkFormField
 
 
@@ -36,14 +38,17 @@ class VarbinaryIPField(models.BinaryField):
         """
         Parse `str`, `bytes` (varbinary), or `netaddr.IPAddress to `netaddr.IPAddress`.
         """
-        try:
-            int_value = int.from_bytes(value, "big")
+        # Already parsed, e.g. `prefix.network` passed directly as a query or field value.
+        if isinstance(value, netaddr.IPAddress):
+            return value
+
+        if isinstance(value, (bytes, bytearray, memoryview)):
             # Distinguish between
             # \x00\x00\x00\x01 (IPv4 0.0.0.1) and
             # \x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01 (IPv6 ::1), among other cases
             version = 4 if len(value) == IPV4_BYTE_LENGTH else 6
-            value = int_value
-        except TypeError:
+            value = int.from_bytes(value, "big")
+        else:
             version = None  # It's a string, IP version should be self-evident
 
         try:
@@ -65,6 +70,14 @@ class VarbinaryIPField(models.BinaryField):
         if value is None:
             return value
 
+        # Fast path for packed values as loaded from the database, which avoids constructing an intermediate
+        # `netaddr.IPAddress` for every row. `inet_ntop()` is also what netaddr itself uses to format addresses.
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            if len(value) == IPV4_BYTE_LENGTH:
+                return socket.inet_ntop(socket.AF_INET, value)
+            if len(value) == IPV6_BYTE_LENGTH:
+                return socket.inet_ntop(socket.AF_INET6, value)
+
         return str(self._parse_address(value))
 
     def get_db_prep_value(self, value, connection, prepared=False):
@@ -0,0 +1,112 @@
+# Generated by Django 4.2.28 on 2026-10-16 09:12
+
+from django.db import migrations, models
+
+import nautobot.core.models.utils
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("ipam", "0054_namespace_tenant"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="ipaddress",
+            name="id",
+            field=models.UUIDField(
+                default=nautobot.core.models.utils.uuid7, editable=False, primary_key=True, serialize=False, unique=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="ipaddresstointerface",
+            name="id",
+            field=models.UUIDField(
+                default=nautobot.core.models.utils.uuid7, editable=False, primary_key=True, serialize=False, unique=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="namespace",
+            name="id",
+            field=models.UUIDField(
+                default=nautobot.core.models.utils.uuid7, editable=False, primary_key=True, serialize=False, unique=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="prefix",
+            name="id",
+            field=models.UUIDField(
+                default=nautobot.core.models.utils.uuid7, editable=False, primary_key=True, serialize=False, unique=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="prefixlocationassignment",
+            name="id",
+            field=models.UUIDField(
+                default=nautobot.core.models.utils.uuid7, editable=False, primary_key=True, serialize=False, unique=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="rir",
+            name="id",
+            field=models.UUIDField(
+                default=nautobot.core.models.utils.uuid7, editable=False, primary_key=True, serialize=False, unique=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="routetarget",
+            name="id",
+            field=models.UUIDField(
+                default=nautobot.core.models.utils.uuid7, editable=False, primary_key=True, serialize=False, unique=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="service",
+            name="id",
+            field=models.UUIDField(
+                default=nautobot.core.models.utils.uuid7, editable=False, primary_key=True, serialize=False, unique=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="vlan",
+            name="id",
+            field=models.UUIDField(
+                default=nautobot.core.models.utils.uuid7, editable=False, primary_key=True, serialize=False, unique=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="vlangroup",
+            name="id",
+            field=models.UUIDField(
+                default=nautobot.core.models.utils.uuid7, editable=False, primary_key=True, serialize=False, unique=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="vlanlocationassignment",
+            name="id",
+            field=models.UUIDField(
+                default=nautobot.core.models.utils.uuid7, editable=False, primary_key=True, serialize=False, unique=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="vrf",
+            name="id",
+            field=models.UUIDField(
+                default=nautobot.core.models.utils.uuid7, editable=False, primary_key=True, serialize=False, unique=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="vrfdeviceassignment",
+            name="id",
+            field=models.UUIDField(
+                default=nautobot.core.models.utils.uuid7, editable=False, primary_key=True, serialize=False, unique=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="vrfprefixassignment",
+            name="id",
+            field=models.UUIDField(
+                default=nautobot.core.models.utils.uuid7, editable=False, primary_key=True, serialize=False, unique=True
+            ),
+        ),
+    ]
@@ -1,6 +1,6 @@
+import bisect
 import contextvars
 import logging
-import operator
 from typing import Optional
 
 from django.contrib.contenttypes.models import ContentType
@@ -13,7 +13,7 @@ import netaddr
 
 from nautobot.core.constants import CHARFIELD_MAX_LENGTH
 from nautobot.core.forms.utils import parse_numeric_range
-from nautobot.core.models import BaseManager, BaseModel
+from nautobot.core.models import BaseManager, BaseModel, UUID7PrimaryKeyMixin
 from nautobot.core.models.fields import JSONArrayField, PositiveRangeNumberTextField
 from nautobot.core.models.generics import OrganizationalModel, PrimaryModel
 from nautobot.core.models.utils import array_to_string
@@ -60,7 +60,7 @@ default_namespace_pk = contextvars.ContextVar("default_namespace_pk", default=No
     "locations",
     "webhooks",
 )
-class Namespace(PrimaryModel):
+class Namespace(UUID7PrimaryKeyMixin, PrimaryModel):
     """Container for unique IPAM objects."""
 
     name = models.CharField(max_length=CHARFIELD_MAX_LENGTH, unique=True, db_index=True)
@@ -129,7 +129,7 @@ def get_default_namespace_pk():
     "statuses",
     "webhooks",
 )
-class VRF(PrimaryModel):
+class VRF(UUID7PrimaryKeyMixin, PrimaryModel):
     """
     A virtual routing and forwarding (VRF) table represents a discrete layer three forwarding domain (e.g. a routing
     table). Prefixes and IPAddresses can optionally be assigned to VRFs. (Prefixes and IPAddresses not assigned to a VRF
@@ -233,6 +233,36 @@ class VRF(PrimaryModel):
 
     add_device.alters_data = True
 
+    def add_devices(self, devices, rd="", name=""):
+        """
+        Add multiple `devices` to this VRF in bulk, optionally overloading `rd` and `name`.
+
+        If `rd` or `name` are not provided, the values from this VRF will be inherited. Devices that are already
+        assigned to this VRF are skipped.
+
+        Args:
+            devices (list, QuerySet): Device instances
+            rd (str): (Optional) RD of the VRF when associated with these Devices
+            name (str): (Optional) Name of the VRF when associated with these Devices
+
+        Returns:
+            list of created VRFDeviceAssignment instances
+        """
+        devices = {device.pk: device for device in devices}
+        existing_device_ids = set(
+            self.device_assignments.filter(device__in=devices).values_list("device_id", flat=True)
+        )
+        instances = [
+            self.devices.through(vrf=self, device=device, rd=rd, name=name)
+            for pk, device in devices.items()
+            if pk not in existing_device_ids
+        ]
+        for instance in instances:
+            instance.full_clean(exclude=["vrf", "device"], validate_unique=False)
+        return self.devices.through.objects.bulk_create(instances, batch_size=1000)
+
+    add_devices.alters_data = True
+
     def remove_device(self, device):
         """
         Remove a `device` from this VRF.
@@ -338,6 +368,33 @@ class VRF(PrimaryModel):
 
     add_prefix.alters_data = True
 
+    def add_prefixes(self, prefixes):
+        """
+        Add multiple `prefixes` to this VRF in bulk. Each object must be in the same Namespace.
+
+        Prefixes that are already assigned to this VRF are skipped.
+
+        Args:
+            prefixes (list, QuerySet): Prefix instances
+
+        Returns:
+            list of created VRFPrefixAssignment instances
+        """
+        prefixes = {prefix.pk: prefix for prefix in prefixes}
+        existing_prefix_ids = set(
+            self.prefixes.through.objects.filter(vrf=self, prefix__in=prefixes).values_list("prefix_id", flat=True)
+        )
+        instances = [
+            self.prefixes.through(vrf=self, prefix=prefix)
+            for pk, prefix in prefixes.items()
+            if pk not in existing_prefix_ids
+        ]
+        for instance in instances:
+            instance.full_clean(exclude=["vrf", "prefix"], validate_unique=False)
+        return self.prefixes.through.objects.bulk_create(instances, batch_size=1000)
+
+    add_prefixes.alters_data = True
+
     def remove_prefix(self, prefix):
         """
         Remove a `prefix` from this VRF.
@@ -355,7 +412,7 @@ class VRF(PrimaryModel):
 
 
 @extras_features("graphql")
-class VRFDeviceAssignment(BaseModel):
+class VRFDeviceAssignment(UUID7PrimaryKeyMixin, BaseModel):
     vrf = models.ForeignKey("ipam.VRF", on_delete=models.CASCADE, related_name="device_assignments")
     device = models.ForeignKey(
         "dcim.Device", null=True, blank=True, on_delete=models.CASCADE, related_name="vrf_assignments"
@@ -426,7 +483,7 @@ class VRFDeviceAssignment(BaseModel):
 
 
 @extras_features("graphql")
-class VRFPrefixAssignment(BaseModel):
+class VRFPrefixAssignment(UUID7PrimaryKeyMixin, BaseModel):
     vrf = models.ForeignKey("ipam.VRF", on_delete=models.CASCADE, related_name="+")
     prefix = models.ForeignKey("ipam.Prefix", on_delete=models.CASCADE, related_name="vrf_assignments")
     is_metadata_associable_model = False
@@ -441,11 +498,12 @@ class VRFPrefixAssignment(BaseModel):
     def clean(self):
         super().clean()
 
-        if self.prefix.namespace != self.vrf.namespace:
+        # Compare the foreign key values so that validation doesn't need to fetch either Namespace.
+        if self.prefix.namespace_id != self.vrf.namespace_id:
             raise ValidationError(
                 {
                     "prefix": f"Prefix (namespace {self.prefix.namespace}) must be in same namespace as "
-                    "VRF (namespace {self.vrf.namespace})"
+                    f"VRF (namespace {self.vrf.namespace})"
                 }
             )
 
@@ -457,7 +515,7 @@ class VRFPrefixAssignment(BaseModel):
     "graphql",
     "webhooks",
 )
-class RouteTarget(PrimaryModel):
+class RouteTarget(UUID7PrimaryKeyMixin, PrimaryModel):
     """
     A BGP extended community used to control the redistribution of routes among VRFs, as defined in RFC 4364.
     """
@@ -487,7 +545,7 @@ class RouteTarget(PrimaryModel):
     "custom_validators",
     "graphql",
 )
-class RIR(OrganizationalModel):
+class RIR(UUID7PrimaryKeyMixin, OrganizationalModel):
     """
     A Regional Internet Registry (RIR) is responsible for the allocation of a large portion of the global IP address
     space. This can be an organization like ARIN or RIPE, or a governing standard such as RFC 1918.
@@ -521,7 +579,7 @@ class RIR(OrganizationalModel):
     "statuses",
     "webhooks",
 )
-class Prefix(PrimaryModel):
+class Prefix(UUID7PrimaryKeyMixin, PrimaryModel):
     """
     A Prefix represents an IPv4 or IPv6 network, including mask length.
     Prefixes can optionally be assigned to Locations and VRFs.
@@ -645,6 +703,7 @@ class Prefix(PrimaryModel):
         self._namespace_id = None
         self._ip_version = None
         self._cleaned = False
+        self._prefix_cache = None
 
         self._deconstruct_prefix(prefix)
 
@@ -720,10 +779,8 @@ class Prefix(PrimaryModel):
 
         Note that for historical reasons this does not directly set `self.parent`, but just returns the candidate.
         """
-        # Closest ancestor by `prefix_length`.
-        if supernets := self.supernets():
-            return max(supernets, key=operator.attrgetter("prefix_length"))
-        return None
+        # Closest ancestor by `prefix_length`, selected in the database rather than by fetching every ancestor.
+        return self.supernets().order_by("-prefix_length").first()
 
     @property
     def _networking_values_changed(self) -> bool:
@@ -886,9 +943,15 @@ class Prefix(PrimaryModel):
 
     @property
     def prefix(self) -> Optional[netaddr.IPNetwork]:
-        if self.cidr_str:
-            return netaddr.IPNetwork(self.cidr_str)
-        return None
+        if self.network is None or self.prefix_length is None:
+            return None
+        # Parsing the CIDR string is comparatively expensive and this is accessed many times per instance
+        # (`__str__`, `display`, `get_available_ips()`, `clean()`...), so cache the parsed value keyed by its inputs.
+        key = (self.network, self.prefix_length)
+        if self._prefix_cache is None or self._prefix_cache[0] != key:
+            self._prefix_cache = (key, netaddr.IPNetwork(self.cidr_str))
+        # IPNetwork is mutable (`+=`, `prefixlen` setter, etc.), so hand out a copy rather than the cached object itself.
+        return netaddr.IPNetwork(self._prefix_cache[1])
 
     @prefix.setter
     def prefix(self, prefix):
@@ -972,9 +1035,12 @@ class Prefix(PrimaryModel):
         if self._networking_values_changed:
             # Former children that we are no longer the closest parent can be reparented to one of our new descendants.
             children_to_reparent = []
-            for child in self.children.filter(prefix_length__gt=self.prefix_length + 1):
+            # Only the fields needed to locate the closest parent and update `parent` are loaded.
+            for child in self.children.filter(prefix_length__gt=self.prefix_length + 1).only(
+                "network", "prefix_length", "parent_id"
+            ):
                 try:
-                    closest_parent = self.children.get_closest_parent(child.prefix)  # pylint: disable=no-member
+                    closest_parent = self.children.only("id").get_closest_parent(child.prefix)  # pylint: disable=no-member
                 except Prefix.DoesNotExist:
                     closest_parent = self
                 if closest_parent != self:
@@ -1013,9 +1079,9 @@ class Prefix(PrimaryModel):
 
             # Former child IPs that we are no longer closest parent of can be reparented to one of our new descendants.
             ips_to_reparent = []
-            for ip in self.ip_addresses.all():
+            for ip in self.ip_addresses.only("host", "parent_id"):
                 try:
-                    closest_parent = self.children.get_closest_parent(ip.host, include_self=True)  # pylint: disable=no-member
+                    closest_parent = self.children.only("id").get_closest_parent(ip.host, include_self=True)  # pylint: disable=no-member
                 except Prefix.DoesNotExist:
                     closest_parent = self
                 if closest_parent != self:
@@ -1048,6 +1114,9 @@ class Prefix(PrimaryModel):
             query = query.select_for_update()
 
         if direct:
+            # A root Prefix has no direct ancestor, so don't query the database at all.
+            if self.parent_id is None:
+                return query.none()
             return query.filter(id=self.parent_id)
 
         if not include_self:
@@ -1162,38 +1231,55 @@ class Prefix(PrimaryModel):
         Return all available Prefixes within this prefix as an IPSet.
         """
         prefix = netaddr.IPSet(self.prefix)
-        child_prefixes = netaddr.IPSet([child.prefix for child in self.descendants()])
+        # Only the network and prefix length of each descendant are needed, so avoid instantiating Prefix objects.
+        child_prefixes = netaddr.IPSet(
+            netaddr.IPNetwork((int(netaddr.IPAddress(network)), prefix_length), version=self.ip_version)
+            for network, prefix_length in self.descendants().values_list("network", "prefix_length")
+        )
         available_prefixes = prefix - child_prefixes
 
         return available_prefixes
 
-    def get_available_ips(self):
+    def _iter_available_ip_ranges(self):
         """
-        Return all available IPs within this prefix as an IPSet.
+        Yield the available IPs within this prefix as sorted, non-overlapping `(first, last)` integer ranges.
+
+        The used host addresses are read in sorted order and swept in a single pass, so this never has to materialize
+        the full address space of the prefix or any `IPAddress` instances.
         """
-        prefix = netaddr.IPSet(self.prefix)
-        child_ips = netaddr.IPSet([ip.address.ip for ip in self.get_all_ips()])
-        available_ips = prefix - child_ips
+        prefix = self.prefix
+        first, last = prefix.first, prefix.last
 
         # IPv6, pool, or IPv4 /31-32 sets are fully usable
-        if any(
+        # For "normal" IPv4 prefixes, omit first and last addresses
+        if not any(
             [
                 self.ip_version == choices.IPAddressVersionChoices.VERSION_6,
                 self.type == choices.PrefixTypeChoices.TYPE_POOL,
                 self.ip_version == choices.IPAddressVersionChoices.VERSION_4 and self.prefix_length >= 31,
             ]
         ):
-            return available_ips
+            first += 1
+            last -= 1
+
+        for host in self.get_all_ips().order_by("host").values_list("host", flat=True).iterator():
+            host = int(netaddr.IPAddress(host))
+            if host > first:
+                yield first, min(host - 1, last)
+            first = max(first, host + 1)
+            if first > last:
+                return
+        yield first, last
 
-        # Omit first and last IP address from the available set
-        # For "normal" IPv4 prefixes, omit first and last addresses
-        available_ips -= netaddr.IPSet(
-            [
-                netaddr.IPAddress(self.prefix.first),
-                netaddr.IPAddress(self.prefix.last),
-            ]
+    def get_available_ips(self):
+        """
+        Return all available IPs within this prefix as an IPSet.
+        """
+        version = self.ip_version
+        return netaddr.IPSet(
+            netaddr.IPRange(netaddr.IPAddress(first, version=version), netaddr.IPAddress(last, version=version))
+            for first, last in self._iter_available_ip_ranges()
         )
-        return available_ips
 
     def get_child_ips(self):
         """
@@ -1249,10 +1335,12 @@ class Prefix(PrimaryModel):
         """
         Return the first available IP within the prefix (or None).
         """
-        available_ips = self.get_available_ips()
-        if not available_ips:
+        # Only the first free range is needed, so stop sweeping the used hosts as soon as one is found.
+        first_range = next(self._iter_available_ip_ranges(), None)
+        if first_range is None:
             return None
-        return f"{next(available_ips.__iter__())}/{self.prefix_length}"
+        first_ip = netaddr.IPAddress(first_range[0], version=self.ip_version)
+        return f"{first_ip}/{self.prefix_length}"
 
     def get_utilization(self):
         """Return the utilization of this prefix as a UtilizationData object.
@@ -1275,9 +1363,11 @@ class Prefix(PrimaryModel):
         Returns:
             UtilizationData (namedtuple): (numerator, denominator)
         """
-        denominator = self.prefix.size
-        child_ips = netaddr.IPSet()
-        child_prefixes = netaddr.IPSet()
+        max_length = 32 if self.ip_version == choices.IPAddressVersionChoices.VERSION_4 else 128
+        # The size of a prefix depends only on its length, so there's no need to build an IPNetwork for it.
+        denominator = 2 ** (max_length - self.prefix_length)
+        child_ips = []
+        child_ranges = []
 
         # NETWORK and POOL prefixes, but not CONTAINER prefixes, count contained IPAddresses towards utilization.
         if self.type != choices.PrefixTypeChoices.TYPE_CONTAINER:
@@ -1287,7 +1377,7 @@ class Prefix(PrimaryModel):
                 host__gte=self.network,
                 host__lte=self.broadcast,
             ).values_list("host", flat=True)
-            child_ips = netaddr.IPSet(pool_ips)
+            child_ips = sorted({int(netaddr.IPAddress(host)) for host in pool_ips})
 
         # CONTAINER and NETWORK prefixes, but not POOL prefixes, count contained Prefixes towards utilization.
         if self.type != choices.PrefixTypeChoices.TYPE_POOL:
@@ -1295,9 +1385,29 @@ class Prefix(PrimaryModel):
             # off around 200 extra SQL queries and shows better performance.
             # Also note that this is meant to be used in conjunction with a Prefetch on an only query. This query is
             # performed in nautobot.ipam.tables.PrefixDetailTable.
-            child_prefixes = netaddr.IPSet(p.prefix for p in self.children.all())
-
-        numerator_set = child_ips | child_prefixes
+            # Child ranges are computed from the integer network and length rather than building IPNetwork objects.
+            for child in self.children.all():
+                first = int(netaddr.IPAddress(child.network))
+                child_ranges.append((first, first + 2 ** (max_length - child.prefix_length) - 1))
+            child_ranges.sort()
+
+        # Merge the child prefix ranges and count any IPs not already covered by one of them.
+        numerator = 0
+        covered = []
+        for first, last in child_ranges:
+            if covered and first <= covered[-1][1] + 1:
+                covered[-1][1] = max(covered[-1][1], last)
+            else:
+                covered.append([first, last])
+        for first, last in covered:
+            numerator += last - first + 1
+        covered_starts = [first for first, _ in covered]
+
+        def is_covered(ip):
+            index = bisect.bisect_right(covered_starts, ip) - 1
+            return index >= 0 and ip <= covered[index][1]
+
+        numerator += sum(1 for ip in child_ips if not is_covered(ip))
 
         # Exclude network and broadcast IPs from the denominator unless they're assigned to an IPAddress or child pool.
         # Only applies to IPv4 network prefixes with a prefix length of /30 or shorter
@@ -1308,14 +1418,16 @@ class Prefix(PrimaryModel):
                 self.ip_version == choices.IPAddressVersionChoices.VERSION_4,
             ]
         ):
-            if not any([self.network in numerator_set, self.broadcast in numerator_set]):
+            used_ips = set(child_ips)
+            network_and_broadcast = (int(netaddr.IPAddress(self.network)), int(netaddr.IPAddress(self.broadcast)))
+            if not any(ip in used_ips or is_covered(ip) for ip in network_and_broadcast):
                 denominator -= 2
 
-        return UtilizationData(numerator=numerator_set.size, denominator=denominator)
+        return UtilizationData(numerator=numerator, denominator=denominator)
 
 
 @extras_features("graphql")
-class PrefixLocationAssignment(BaseModel):
+class PrefixLocationAssignment(UUID7PrimaryKeyMixin, BaseModel):
     prefix = models.ForeignKey("ipam.Prefix", on_delete=models.CASCADE, related_name="location_assignments")
     location = models.ForeignKey("dcim.Location", on_delete=models.CASCADE, related_name="prefix_assignments")
     is_metadata_associable_model = False
@@ -1336,7 +1448,7 @@ class PrefixLocationAssignment(BaseModel):
     "statuses",
     "webhooks",
 )
-class IPAddress(PrimaryModel):
+class IPAddress(UUID7PrimaryKeyMixin, PrimaryModel):
     """
     An IPAddress represents an individual IPv4 or IPv6 address and its mask. The mask length should match what is
     configured in the real world. (Typically, only loopback interfaces are configured with /32 or /128 masks.) Like
@@ -1426,6 +1538,8 @@ class IPAddress(PrimaryModel):
 
         self._parent = None
         self._host = None
+        self._address_cache = None
+        self._closest_parent_cache = None
 
         if namespace is not None and not self.present_in_database:
             self._provided_namespace = namespace
@@ -1460,23 +1574,28 @@ class IPAddress(PrimaryModel):
     natural_key_field_names = ["parent__namespace", "host"]
 
     def _get_closest_parent(self):
-        # TODO: Implement proper caching of `closest_parent` and ensure the cache is invalidated when
-        #  `_namespace` changes. Currently, `_get_closest_parent` is called twice, in the `clean` and `save` methods.
-        #  Caching would improve performance.
-
         # Host and maxlength are required to get the closest_parent
         empty_values = [None, b"", ""]
         if self.host in empty_values or self.mask_length in empty_values:
             return None
+
+        # `clean()` is typically called twice (by `full_clean()` and again by `save()`), so the result is cached until
+        # the next save, keyed by the namespace and host it was computed for.
+        namespace_id = self._namespace_id
+        key = (namespace_id, self.host)
+        if self._closest_parent_cache is not None and self._closest_parent_cache[0] == key:
+            return self._closest_parent_cache[1]
+
         try:
-            closest_parent = Prefix.objects.filter(namespace=self._namespace).get_closest_parent(
+            closest_parent = Prefix.objects.filter(namespace_id=namespace_id).get_closest_parent(
                 self.host, include_self=True
             )
-            return closest_parent
         except Prefix.DoesNotExist as e:
             raise ValidationError(
                 {"namespace": f"No suitable parent Prefix for {self.host} exists in Namespace {self._namespace}"}
             ) from e
+        self._closest_parent_cache = (key, closest_parent)
+        return closest_parent
 
     def clean(self):
         self._deconstruct_address(self.address)
@@ -1512,8 +1631,7 @@ class IPAddress(PrimaryModel):
             self._namespace = None
 
         # Force dns_name to lowercase
-        if not self.dns_name.islower:
-            self.dns_name = self.dns_name.lower()
+        self.dns_name = self.dns_name.lower()
 
         super().clean()
 
@@ -1526,13 +1644,19 @@ class IPAddress(PrimaryModel):
 
         self._parent = self.parent
         self._host = self.host
+        # Other Prefixes may be created before this instance is next saved, so don't reuse the cached parent.
+        self._closest_parent_cache = None
 
     @property
     def address(self):
-        if self.host is not None and self.mask_length is not None:
-            cidr = f"{self.host}/{self.mask_length}"
-            return netaddr.IPNetwork(cidr)
-        return None
+        if self.host is None or self.mask_length is None:
+            return None
+        # Parsing is relatively expensive, so cache the parsed value until `host` or `mask_length` change.
+        # A copy is returned since IPNetwork objects are mutable.
+        key = (self.host, self.mask_length)
+        if self._address_cache is None or self._address_cache[0] != key:
+            self._address_cache = (key, netaddr.IPNetwork(f"{self.host}/{self.mask_length}"))
+        return netaddr.IPNetwork(self._address_cache[1])
 
     @address.setter
     def address(self, address):
@@ -1574,13 +1698,24 @@ class IPAddress(PrimaryModel):
         return query
 
     @property
-    def _namespace(self):
+    def _namespace_id(self):
         # if a namespace was explicitly set, use it
         if getattr(self, "_provided_namespace", None):
-            return self._provided_namespace
+            return getattr(self._provided_namespace, "pk", self._provided_namespace)
         if self.parent is not None:
+            return self.parent.namespace_id
+        return get_default_namespace_pk()
+
+    @property
+    def _namespace(self):
+        provided_namespace = getattr(self, "_provided_namespace", None)
+        if isinstance(provided_namespace, Namespace):
+            return provided_namespace
+        if not provided_namespace and self.parent is not None:
             return self.parent.namespace
-        return get_default_namespace()
+        # only a pk is known; fall back to it as-is if it doesn't match an existing Namespace
+        namespace_id = self._namespace_id
+        return Namespace.objects.filter(pk=namespace_id).first() or namespace_id
 
     @_namespace.setter
     def _namespace(self, namespace):
@@ -1603,7 +1738,7 @@ class IPAddress(PrimaryModel):
 
 
 @extras_features("graphql")
-class IPAddressToInterface(BaseModel):
+class IPAddressToInterface(UUID7PrimaryKeyMixin, BaseModel):
     ip_address = models.ForeignKey("ipam.IPAddress", on_delete=models.CASCADE, related_name="interface_assignments")
     interface = models.ForeignKey(
         "dcim.Interface", blank=True, null=True, on_delete=models.CASCADE, related_name="ip_address_assignments"
@@ -1659,7 +1794,7 @@ class IPAddressToInterface(BaseModel):
     "locations",
     "webhooks",
 )
-class VLANGroup(PrimaryModel):
+class VLANGroup(UUID7PrimaryKeyMixin, PrimaryModel):
     """
     A VLAN group is an arbitrary collection of VLANs within which VLAN IDs and names must be unique.
     """
@@ -1699,8 +1834,9 @@ class VLANGroup(PrimaryModel):
         """
         Return all available VLAN IDs within this VLANGroup as a list.
         """
-        used_ids = self.vlans.all().values_list("vid", flat=True)
-        available = sorted([vid for vid in self.expanded_range if vid not in used_ids])
+        used_ids = set(self.vlans.all().values_list("vid", flat=True))
+        # expanded_range is already sorted
+        available = [vid for vid in self.expanded_range if vid not in used_ids]
 
         return available
 
@@ -1708,7 +1844,9 @@ class VLANGroup(PrimaryModel):
         super().clean()
         # Validate location
         if self.location is not None:
-            if ContentType.objects.get_for_model(self) not in self.location.location_type.content_types.all():
+            if not self.location.location_type.content_types.filter(
+                pk=ContentType.objects.get_for_model(self).pk
+            ).exists():
                 raise ValidationError(
                     {"location": f'VLAN groups may not associate to locations of type "{self.location.location_type}".'}
                 )
@@ -1730,8 +1868,8 @@ class VLANGroup(PrimaryModel):
         """
         Return the first available VLAN ID in the group's range.
         """
-        _available_vids = self.available_vids
-        return _available_vids[0] if _available_vids else None
+        used_ids = set(self.vlans.all().values_list("vid", flat=True))
+        return next((vid for vid in self.expanded_range if vid not in used_ids), None)
 
 
 @extras_features(
@@ -1743,7 +1881,7 @@ class VLANGroup(PrimaryModel):
     "statuses",
     "webhooks",
 )
-class VLAN(PrimaryModel):
+class VLAN(UUID7PrimaryKeyMixin, PrimaryModel):
     """
     A VLAN is a distinct layer two forwarding domain identified by a 12-bit integer (1-4094).
     Each VLAN must be assigned to a Location, however VLAN IDs need not be unique within a Location.
@@ -1844,11 +1982,16 @@ class VLAN(PrimaryModel):
 
     def get_interfaces(self):
         # Return all device interfaces assigned to this VLAN
-        return Interface.objects.filter(Q(untagged_vlan_id=self.pk) | Q(tagged_vlans=self.pk)).distinct()
+        # The tagged VLANs are matched via a subquery so that the M2M join can't duplicate rows and no DISTINCT is needed
+        return Interface.objects.filter(
+            Q(untagged_vlan_id=self.pk) | Q(pk__in=Interface.objects.filter(tagged_vlans=self.pk).values("pk"))
+        )
 
     def get_vminterfaces(self):
         # Return all VM interfaces assigned to this VLAN
-        return VMInterface.objects.filter(Q(untagged_vlan_id=self.pk) | Q(tagged_vlans=self.pk)).distinct()
+        return VMInterface.objects.filter(
+            Q(untagged_vlan_id=self.pk) | Q(pk__in=VMInterface.objects.filter(tagged_vlans=self.pk).values("pk"))
+        )
 
     @property
     def interfaces(self):
@@ -1867,7 +2010,7 @@ class VLAN(PrimaryModel):
 
 
 @extras_features("graphql")
-class VLANLocationAssignment(BaseModel):
+class VLANLocationAssignment(UUID7PrimaryKeyMixin, BaseModel):
     vlan = models.ForeignKey("ipam.VLAN", on_delete=models.CASCADE, related_name="location_assignments")
     location = models.ForeignKey("dcim.Location", on_delete=models.CASCADE, related_name="vlan_assignments")
     is_metadata_associable_model = False
@@ -1887,7 +2030,7 @@ class VLANLocationAssignment(BaseModel):
     "graphql",
     "webhooks",
 )
-class Service(PrimaryModel):
+class Service(UUID7PrimaryKeyMixin, PrimaryModel):
     """
     A Service represents a layer-four service (e.g. HTTP or SSH) running on a Device or VirtualMachine. A Service may
     optionally be tied to one or more specific IPAddresses belonging to its parent.
@@ -1957,4 +2100,11 @@ class Service(PrimaryModel):
 
     @property
     def port_list(self):
-        return array_to_string(self.ports)
+        # This is rendered repeatedly (`__str__`, tables, API), so reuse the formatted string until `ports` changes.
+        # `ports` is a mutable list, so the cache is keyed by a snapshot of its contents rather than by identity.
+        key = tuple(self.ports)
+        cached = getattr(self, "_port_list_cache", None)
+        if cached is None or cached[0] != key:
+            cached = (key, array_to_string(key))
+            self._port_list_cache = cached
+        return cached[1]
@@ -2,6 +2,7 @@ import re
 
 from django.core.exceptions import ValidationError
 from django.core.validators import validate_ipv46_address
+from django.db import transaction
 from django.db.models import ProtectedError, Q
 import netaddr
 
@@ -329,8 +330,10 @@ class PrefixQuerySet(LocationToLocationsQuerySetMixin, BaseNetworkQuerySet):
 
             # Update protected objects to use grand-parent of the parent Prefix and delete the old
             # parent. This should be equivalent at the row level of saying `parent=self.parent`.
-            protected_objects.update(parent=new_parent)
-            return super().delete(*args, **kwargs)
+            # Both statements run in one transaction so a failed retry doesn't leave objects half-reparented.
+            with transaction.atomic(using=self.db):
+                protected_objects.update(parent=new_parent)
+                return super().delete(*args, **kwargs)
 
     def _validate_cidr(self, value):
         """
@@ -133,7 +133,7 @@ def assert_locations_content_types(sender, instance, action, reverse, model, pk_
         model_ct = ContentType.objects.get_for_model(model)
         key = "prefixes" if model is Prefix else "vlans"
         label = "Prefixes" if model is Prefix else "VLANs"
-        if model_ct not in instance.location_type.content_types.all():
+        if not instance.location_type.content_types.filter(pk=model_ct.pk).exists():
             raise ValidationError(
                 {key: f"{instance} is a {instance.location_type} and may not have {label} associated to it."}
             )
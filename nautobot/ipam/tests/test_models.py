@@ -1,5 +1,6 @@
 from unittest import skipIf
 from unittest.mock import patch
+import uuid
 
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
@@ -13,6 +14,7 @@ from nautobot.dcim import choices as dcim_choices
 from nautobot.dcim.models import Device, DeviceType, Interface, Location, LocationType, Module, ModuleBay, ModuleType
 from nautobot.extras.models import Role, Status
 from nautobot.ipam.choices import IPAddressTypeChoices, PrefixTypeChoices, ServiceProtocolChoices
+from nautobot.ipam.constants import VRF_RD_MAX_LENGTH
 from nautobot.ipam.models import (
     get_default_namespace,
     IPAddress,
@@ -26,6 +28,7 @@ from nautobot.ipam.models import (
     VLANGroup,
     VRF,
 )
+from nautobot.ipam.querysets import PrefixQuerySet
 from nautobot.virtualization.models import Cluster, ClusterType, VirtualMachine, VMInterface
 
 
@@ -789,6 +792,13 @@ class TestVarbinaryIPField(TestCase):
         # netaddr.IPAddress => str
         self.assertEqual(self.field.to_python(self.prefix.prefix.ip), self.network)
 
+        # bytes/memoryview (as loaded from the database) => str, formatted identically to netaddr
+        for address in ("10.0.0.0", "0.0.0.1", "::1", "::192.0.2.15", "::ffff:192.0.2.15", "2001:db8::1:0:0:1"):
+            with self.subTest(address=address):
+                packed = netaddr.IPAddress(address).packed
+                self.assertEqual(self.field.to_python(packed), str(netaddr.IPAddress(address)))
+                self.assertEqual(self.field.to_python(memoryview(packed)), str(netaddr.IPAddress(address)))
+
     @skipIf(
         connection.vendor != "postgresql",
         "postgres is not the database driver",
@@ -1428,6 +1438,23 @@ class TestPrefix(ModelTestCases.BaseModelTestCase):
         child_ip_pks = {p.pk for p in parent_prefix_31.ip_addresses.all()}
         self.assertSetEqual(child_ip_pks, {ips_31[0].pk, ips_31[1].pk})
 
+    def test_prefix_property_cache(self):
+        prefix = Prefix(prefix="10.0.0.0/24", status=self.status, namespace=self.namespace)
+        self.assertEqual(prefix.prefix, netaddr.IPNetwork("10.0.0.0/24"))
+
+        # Mutating the returned value must not affect the cached value
+        network = prefix.prefix
+        network += 1
+        self.assertEqual(prefix.prefix, netaddr.IPNetwork("10.0.0.0/24"))
+
+        # The cached value is invalidated when any of its inputs change
+        prefix.prefix_length = 16
+        self.assertEqual(prefix.prefix, netaddr.IPNetwork("10.0.0.0/16"))
+        prefix.network = "10.1.0.0"
+        self.assertEqual(prefix.prefix, netaddr.IPNetwork("10.1.0.0/16"))
+        prefix.prefix = "192.0.2.0/25"
+        self.assertEqual(str(prefix), "192.0.2.0/25")
+
     def test_get_available_prefixes(self):
         prefixes = [
             Prefix(
@@ -1479,6 +1506,17 @@ class TestPrefix(ModelTestCases.BaseModelTestCase):
         available_ips = parent_prefix.get_available_ips()
         self.assertEqual(available_ips, missing_ips)
 
+    def test_get_available_ips_pool(self):
+        parent_prefix = Prefix.objects.create(
+            prefix="10.0.0.0/29", status=self.status, namespace=self.namespace, type=PrefixTypeChoices.TYPE_POOL
+        )
+        for address in ["10.0.0.0/29", "10.0.0.4/29", "10.0.0.7/29"]:
+            IPAddress.objects.create(address=address, status=self.status, namespace=self.namespace)
+        self.assertEqual(
+            parent_prefix.get_available_ips(),
+            netaddr.IPSet(["10.0.0.1/32", "10.0.0.2/31", "10.0.0.5/32", "10.0.0.6/32"]),
+        )
+
     def test_get_first_available_prefix(self):
         prefixes = [
             Prefix(
@@ -1809,6 +1847,80 @@ class TestIPAddress(ModelTestCases.BaseModelTestCase):
         self.status = Status.objects.get(name="Active")
         self.prefix = Prefix.objects.create(prefix="192.0.2.0/24", status=self.status, namespace=self.namespace)
 
+    def test_address_property_cache(self):
+        ip = IPAddress(address="192.0.2.1/24", status=self.status, namespace=self.namespace)
+        self.assertEqual(ip.address, netaddr.IPNetwork("192.0.2.1/24"))
+
+        # Mutating the returned value must not affect the cached value
+        address = ip.address
+        address += 1
+        self.assertEqual(ip.address, netaddr.IPNetwork("192.0.2.1/24"))
+
+        # The cached value is invalidated when any of its inputs change
+        ip.mask_length = 32
+        self.assertEqual(ip.address, netaddr.IPNetwork("192.0.2.1/32"))
+        ip.address = "192.0.2.2/25"
+        self.assertEqual(str(ip), "192.0.2.2/25")
+
+    def test_closest_parent_lookup_cached(self):
+        with patch.object(
+            PrefixQuerySet, "get_closest_parent", autospec=True, side_effect=PrefixQuerySet.get_closest_parent
+        ) as mock_get_closest_parent:
+            with self.subTest("validated_save() looks up the closest parent only once"):
+                ip = IPAddress(address="192.0.2.1/24", status=self.status, namespace=self.namespace)
+                ip.validated_save()
+                self.assertEqual(mock_get_closest_parent.call_count, 1)
+                self.assertEqual(ip.parent, self.prefix)
+
+            with self.subTest("Changing the host between clean() calls triggers a new lookup"):
+                mock_get_closest_parent.reset_mock()
+                ip = IPAddress(address="192.0.2.2/24", status=self.status, namespace=self.namespace)
+                ip.clean()
+                ip.address = "192.0.2.3/24"
+                ip.clean()
+                self.assertEqual(mock_get_closest_parent.call_count, 2)
+                self.assertEqual(ip.host, "192.0.2.3")
+
+            with self.subTest("Changing the namespace between clean() calls triggers a new lookup"):
+                mock_get_closest_parent.reset_mock()
+                other_namespace = Namespace.objects.create(name="Other Namespace")
+                other_prefix = Prefix.objects.create(
+                    prefix="192.0.2.0/24", status=self.status, namespace=other_namespace
+                )
+                ip = IPAddress(address="192.0.2.4/24", status=self.status, namespace=self.namespace)
+                ip.clean()
+                self.assertEqual(ip.parent, self.prefix)
+                ip._namespace = other_namespace
+                ip.clean()
+                self.assertEqual(mock_get_closest_parent.call_count, 2)
+                self.assertEqual(ip.parent, other_prefix)
+
+    def test_namespace_property(self):
+        ip = IPAddress.objects.create(address="192.0.2.1/24", status=self.status, namespace=self.namespace)
+        ip = IPAddress.objects.select_related("parent__namespace").get(pk=ip.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(ip._namespace, self.namespace)
+
+        ip = IPAddress(address="192.0.2.2/24", status=self.status)
+        ip._namespace = self.namespace.pk
+        self.assertEqual(ip._namespace, self.namespace)
+
+        # An unknown namespace pk is reported as-is rather than raising Namespace.DoesNotExist
+        missing_pk = uuid.uuid4()
+        ip._namespace = missing_pk
+        self.assertEqual(ip._namespace, missing_pk)
+        with self.assertRaisesMessage(
+            ValidationError, f"No suitable parent Prefix for 192.0.2.2 exists in Namespace {missing_pk}"
+        ):
+            ip.clean()
+
+    def test_dns_name_lowercased(self):
+        ip = IPAddress(
+            address="192.0.2.1/24", status=self.status, namespace=self.namespace, dns_name="Host-1.EXAMPLE.com"
+        )
+        ip.clean()
+        self.assertEqual(ip.dns_name, "host-1.example.com")
+
     def test_get_or_create(self):
         """Assert `get_or_create` method to permit specifying a namespace as an alternative to a parent prefix."""
         default_namespace = get_default_namespace()
@@ -2155,6 +2267,15 @@ class TestService(ModelTestCases.BaseModelTestCase):
             ports=[101],
         )
 
+    def test_port_list(self):
+        service = Service(name="Service 2", protocol=ServiceProtocolChoices.PROTOCOL_TCP, ports=[22, 80, 81, 82])
+        self.assertEqual(service.port_list, "22, 80-82")
+        # The cached value is invalidated by in-place changes as well as reassignment
+        service.ports.append(83)
+        self.assertEqual(service.port_list, "22, 80-83")
+        service.ports = [443]
+        self.assertEqual(service.port_list, "443")
+
 
 class TestVLANGroup(ModelTestCases.BaseModelTestCase):
     model = VLANGroup
@@ -2279,4 +2400,54 @@ class TestVLAN(ModelTestCases.BaseModelTestCase):
 
 class TestVRF(ModelTestCases.BaseModelTestCase):
     model = VRF
-    # TODO(jathan): Add VRF model tests.
+
+    def test_add_devices(self):
+        location = Location.objects.filter(location_type=LocationType.objects.get(name="Campus")).first()
+        devicetype = DeviceType.objects.first()
+        devicerole = Role.objects.get_for_model(Device).first()
+        devicestatus = Status.objects.get_for_model(Device).first()
+        devices = [
+            Device.objects.create(
+                name=f"VRF Device {i}", location=location, device_type=devicetype, role=devicerole, status=devicestatus
+            )
+            for i in range(3)
+        ]
+        vrf = VRF.objects.create(name="VRF Green", rd="65000:100", namespace=Namespace.objects.first())
+        vrf.add_device(devices[0], rd="65000:999", name="overridden")
+
+        # One query to find the existing assignments and one to insert the new ones
+        with self.assertNumQueries(2):
+            created = vrf.add_devices(devices)
+        self.assertEqual(len(created), 2)
+        self.assertEqual(set(vrf.devices.all()), set(devices))
+        # The existing assignment is left alone and the new ones inherit `rd` and `name` from the VRF
+        self.assertEqual(vrf.device_assignments.get(device=devices[0]).rd, "65000:999")
+        for device in devices[1:]:
+            assignment = vrf.device_assignments.get(device=device)
+            self.assertEqual(assignment.rd, "65000:100")
+            self.assertEqual(assignment.name, "VRF Green")
+
+        vrf.remove_device(devices[1])
+        with self.assertRaises(ValidationError):
+            vrf.add_devices([devices[1]], rd="x" * (VRF_RD_MAX_LENGTH + 1))
+
+    def test_add_prefixes(self):
+        namespace = Namespace.objects.create(name="test_add_prefixes")
+        status = Status.objects.get_for_model(Prefix).first()
+        vrf = VRF.objects.create(name="VRF Blue", namespace=namespace)
+        prefixes = [
+            Prefix.objects.create(prefix=f"10.{i}.0.0/16", status=status, namespace=namespace) for i in range(3)
+        ]
+        vrf.add_prefix(prefixes[0])
+
+        # One query to find the existing assignments and one to insert the new ones
+        with self.assertNumQueries(2):
+            created = vrf.add_prefixes(prefixes)
+        self.assertEqual(len(created), 2)
+        self.assertEqual(set(vrf.prefixes.all()), set(prefixes))
+
+        other_prefix = Prefix.objects.create(
+            prefix="198.51.100.0/24", status=status, namespace=Namespace.objects.create(name="test_add_prefixes_other")
+        )
+        with self.assertRaises(ValidationError):
+            vrf.add_prefixes([other_prefix])